@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Process:
     """
     Represents a process in a CPU scheduling simulation.
@@ -64,9 +64,7 @@ class Process:
         """
         if not isinstance(other, Process):
             return NotImplemented
-        if self.priority != other.priority:
-            return self.priority < other.priority
-        return self.id < other.id
+        return (self.priority, self.id) < (other.priority, other.id)
     
     def update_waiting_time(self, current_time: int) -> None:
         """
@@ -78,7 +76,8 @@ class Process:
         if self.state == "READY":
             wait_period = current_time - self.last_running_time
             self.waiting_time += wait_period
-            self.max_waiting_time = max(self.max_waiting_time, wait_period)
+            if wait_period > self.max_waiting_time:
+                self.max_waiting_time = wait_period
     
     def execute(self, time_slice: int) -> int:
         """
@@ -90,17 +89,13 @@ class Process:
         Returns:
             int: Amount of time actually used (may be less than time_slice if process completes).
         """
-        if self.remaining_time <= 0:
+        remaining = self.remaining_time
+        if remaining <= 0:
             return 0
             
-        # Track first response if this is the first execution
-        if self.cpu_time_acquired == 0 and self.response_time is None:
-            # Response time would be calculated from arrival to first execution
-            pass
-            
-        time_used = min(time_slice, self.remaining_time)
+        time_used = time_slice if time_slice < remaining else remaining
         self.cpu_time_acquired += time_used
-        self.remaining_time -= time_used
+        self.remaining_time = remaining - time_used
         self.state = "RUNNING"
         
         return time_used
@@ -115,6 +110,7 @@ class Process:
         self.state = "COMPLETED"
         self.completion_time = current_time
         self.turnaround_time = current_time - self.arrival_time
+        self.waiting_time = self.turnaround_time - self.burst_time
         self.remaining_time = 0
     
     def is_completed(self) -> bool:
@@ -136,28 +132,21 @@ class Process:
 
 
     def copy(self):
-        """Create a deep copy of the process object."""
+        """Create a deep copy of the process object (every field is an immutable value)."""
         new_process = Process(
             id=self.id,
             burst_time=self.burst_time,
             priority=self.priority,
-            arrival_time=self.arrival_time
+            arrival_time=self.arrival_time,
+            waiting_time=self.waiting_time,
+            cpu_time_acquired=self.cpu_time_acquired,
+            turnaround_time=self.turnaround_time,
+            last_running_time=self.last_running_time,
+            max_waiting_time=self.max_waiting_time,
+            age=self.age,
+            completion_time=self.completion_time,
+            response_time=self.response_time,
+            state=self.state
         )
-        
-        # Copy other attributes if they exist
-        if hasattr(self, 'waiting_time'):
-            new_process.waiting_time = self.waiting_time
-            
-        if hasattr(self, 'turnaround_time'):
-            new_process.turnaround_time = self.turnaround_time
-            
-        if hasattr(self, 'completion_time'):
-            new_process.completion_time = self.completion_time
-            
-        if hasattr(self, 'response_time'):
-            new_process.response_time = self.response_time
-            
-        if hasattr(self, 'remaining_time'):
-            new_process.remaining_time = self.remaining_time
-            
+        new_process.remaining_time = self.remaining_time
         return new_process
\ No newline at end of file
@@ -0,0 +1,148 @@
+from itertools import starmap
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ProcessClass.process import Process
+
+
+class ProcessTable:
+    """
+    Struct-of-Arrays view of a set of processes.
+
+    Every numeric attribute of `Process` is stored as its own contiguous NumPy
+    column, so bulk operations (CSV I/O, sorting, hashing) run on whole arrays
+    instead of walking a list of objects.
+
+    Attributes:
+        id (np.ndarray): Unique process identifiers.
+        burst_time (np.ndarray): Total CPU time required by each process.
+        priority (np.ndarray): Priority level of each process (lower value means higher priority).
+        arrival_time (np.ndarray): Time when each process enters the ready queue.
+        waiting_time (np.ndarray): Time spent waiting in the ready queue.
+        turnaround_time (np.ndarray): Total time from arrival to completion.
+        remaining_time (np.ndarray): Remaining burst time to complete each process.
+        completion_time (np.ndarray): Completion time, or -1 while not completed.
+        response_time (np.ndarray): Time from arrival to first CPU allocation, or -1 if not yet known.
+    """
+
+    COLUMNS = ("id", "burst_time", "priority", "arrival_time", "waiting_time",
+               "turnaround_time", "remaining_time", "completion_time", "response_time")
+    INPUT_COLUMNS = ("id", "burst_time", "priority", "arrival_time")
+    DTYPE = np.int64
+
+    def __init__(self, n: int):
+        """
+        Allocate an empty table with room for `n` processes.
+
+        Args:
+            n (int): Number of processes (rows) in the table.
+        """
+        self.id = np.arange(1, n + 1, dtype=self.DTYPE)
+        self.burst_time = np.zeros(n, dtype=self.DTYPE)
+        self.priority = np.zeros(n, dtype=self.DTYPE)
+        self.arrival_time = np.zeros(n, dtype=self.DTYPE)
+        self.waiting_time = np.zeros(n, dtype=self.DTYPE)
+        self.turnaround_time = np.zeros(n, dtype=self.DTYPE)
+        self.remaining_time = np.zeros(n, dtype=self.DTYPE)
+        self.completion_time = np.full(n, -1, dtype=self.DTYPE)
+        self.response_time = np.full(n, -1, dtype=self.DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @classmethod
+    def from_columns(cls, ids: Sequence[int], burst_times: Sequence[int],
+                     priorities: Sequence[int], arrival_times: Sequence[int]) -> 'ProcessTable':
+        """
+        Build a table directly from the four input columns.
+
+        Args:
+            ids: Process identifiers.
+            burst_times: Burst time of each process.
+            priorities: Priority of each process.
+            arrival_times: Arrival time of each process.
+
+        Returns:
+            ProcessTable: A new table whose remaining time equals the burst time.
+        """
+        table = cls(len(ids))
+        table.id[:] = ids
+        table.burst_time[:] = burst_times
+        table.priority[:] = priorities
+        table.arrival_time[:] = arrival_times
+        table.remaining_time[:] = table.burst_time
+        return table
+
+    def to_list(self) -> List[Process]:
+        """
+        Convert the table back into `Process` objects for the schedulers.
+
+        Returns:
+            List[Process]: One process per row, in table order.
+        """
+        return [self._make_process(row) for row in zip(*(getattr(self, column).tolist() for column in self.COLUMNS))]
+
+    def new_processes(self) -> List[Process]:
+        """
+        Create fresh, not yet scheduled `Process` objects from the input columns.
+
+        Lets one immutable table act as the snapshot every scheduler run starts from,
+        instead of copying the previous run's objects field by field.
+
+        Returns:
+            List[Process]: One new process per row, in table order.
+        """
+        return list(starmap(Process, zip(*(getattr(self, column).tolist() for column in self.INPUT_COLUMNS))))
+
+    def __getitem__(self, index: int) -> Process:
+        """Materialize a single row as a `Process` on demand."""
+        return self._make_process(tuple(getattr(self, column)[index].item() for column in self.COLUMNS))
+
+    def __iter__(self):
+        """Iterate over the rows as `Process` objects, one at a time."""
+        return (self[index] for index in range(len(self)))
+
+    def _make_process(self, row: tuple) -> Process:
+        """Build a `Process` from a row of COLUMNS values."""
+        values = dict(zip(self.COLUMNS, row))
+        process = Process(
+            id=values["id"],
+            burst_time=values["burst_time"],
+            priority=values["priority"],
+            arrival_time=values["arrival_time"],
+            waiting_time=values["waiting_time"],
+            turnaround_time=values["turnaround_time"],
+            completion_time=self._optional(values["completion_time"]),
+            response_time=self._optional(values["response_time"])
+        )
+        process.remaining_time = values["remaining_time"]
+        return process
+
+    def stack(self, columns: Sequence[str] = INPUT_COLUMNS) -> np.ndarray:
+        """
+        Return the requested columns as a single 2D array (one row per process).
+
+        Args:
+            columns: Names of the columns to stack. Defaults to the input columns.
+
+        Returns:
+            np.ndarray: Array of shape (len(self), len(columns)).
+        """
+        return np.column_stack([getattr(self, column) for column in columns])
+
+    def save_csv(self, filename: str, columns: Sequence[str] = INPUT_COLUMNS) -> None:
+        """
+        Write the table to a CSV file with a header row.
+
+        Args:
+            filename (str): Destination path.
+            columns: Names of the columns to write. Defaults to the input columns.
+        """
+        np.savetxt(filename, self.stack(columns), fmt='%d', delimiter=',',
+                   header=','.join(columns), comments='')
+
+    @staticmethod
+    def _optional(value: int) -> Optional[int]:
+        """Map the -1 sentinel back to None."""
+        return None if value < 0 else value
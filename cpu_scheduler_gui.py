@@ -4,14 +4,16 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import csv
 import os
-from ProcessClass.process import Process
+import numpy as np
+import pandas as pd
+from ProcessClass.process_table import ProcessTable
 from schedulers.FCFS import FCFSScheduler
 from schedulers.SJF import SJFScheduler
 from schedulers.PrioritySchedule import PriorityScheduler
 from schedulers.RR import RoundRobinScheduler
 from schedulers.RR_Priority import PriorityRoundRobinScheduler
+from utils.file_io import write_execution_csv
 
 SCHEDULERS = {
     "FCFS": {"class": FCFSScheduler, "params": []},
@@ -27,10 +29,15 @@ class CPUSchedulerGUI:
         self.root.title("CPU Scheduler Simulator")
 
         self.processes = []
+        self.results_cache = {}
 
         self.scheduler_var = tk.StringVar(value="FCFS")
         self.time_quantum_var = tk.StringVar()
         self.aging_factor_var = tk.StringVar()
+        self.param_inputs = {
+            "time_quantum": ("Time Quantum", self.time_quantum_var),
+            "aging_factor": ("Aging Factor", self.aging_factor_var),
+        }
 
         self.build_gui()
 
@@ -63,24 +70,19 @@ class CPUSchedulerGUI:
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
     def update_param_fields(self, event=None):
-        scheduler = self.scheduler_var.get()
-        self.time_quantum_entry.configure(state='normal' if "time_quantum" in SCHEDULERS[scheduler]["params"] else 'disabled')
-        self.aging_factor_entry.configure(state='normal' if "aging_factor" in SCHEDULERS[scheduler]["params"] else 'disabled')
+        params = SCHEDULERS[self.scheduler_var.get()]["params"]
+        self.time_quantum_entry.configure(state='normal' if "time_quantum" in params else 'disabled')
+        self.aging_factor_entry.configure(state='normal' if "aging_factor" in params else 'disabled')
 
     def load_csv(self):
         path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
         if not path: return
         try:
-            self.processes = []
-            with open(path, newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    self.processes.append(Process(
-                        id=int(row['id']),
-                        burst_time=int(row['burst_time']),
-                        priority=int(row['priority']),
-                        arrival_time=int(row['arrival_time'])
-                    ))
+            df = pd.read_csv(path, usecols=ProcessTable.INPUT_COLUMNS, dtype=np.int64)
+            self.processes = ProcessTable.from_columns(
+                df['id'], df['burst_time'], df['priority'], df['arrival_time']
+            ).to_list()
+            self.results_cache.clear()
             messagebox.showinfo("Loaded", f"Loaded {len(self.processes)} processes from {os.path.basename(path)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load CSV: {e}")
@@ -91,35 +93,45 @@ class CPUSchedulerGUI:
             return
 
         scheduler_name = self.scheduler_var.get()
-        SchedulerClass = SCHEDULERS[scheduler_name]['class']
+        scheduler_info = SCHEDULERS[scheduler_name]
+        SchedulerClass = scheduler_info['class']
+        params = scheduler_info['params']
         kwargs = {}
 
-        if 'time_quantum' in SCHEDULERS[scheduler_name]['params']:
+        for param in params:
+            label, variable = self.param_inputs[param]
             try:
-                kwargs['time_quantum'] = int(self.time_quantum_var.get())
+                kwargs[param] = int(variable.get())
             except ValueError:
-                messagebox.showerror("Invalid Input", "Time Quantum must be an integer")
+                messagebox.showerror("Invalid Input", f"{label} must be an integer")
                 return
 
-        if 'aging_factor' in SCHEDULERS[scheduler_name]['params']:
+        # Processes only change on load_csv, so identical runs reuse the previous result
+        cache_key = (scheduler_name, tuple(sorted(kwargs.items())))
+        cached = self.results_cache.get(cache_key)
+        if cached is None:
             try:
-                kwargs['aging_factor'] = int(self.aging_factor_var.get())
-            except ValueError:
-                messagebox.showerror("Invalid Input", "Aging Factor must be an integer")
+                scheduler = SchedulerClass(self.processes.copy(), **kwargs)
+            except ValueError as e:
+                messagebox.showerror("Invalid Input", str(e))
                 return
+            cached = self.results_cache[cache_key] = scheduler, scheduler.run()
+        else:
+            write_execution_csv(cached[0].gantt_chart)  # keep the exported timeline in sync with this run
+        completed = cached[1]
 
-        scheduler = SchedulerClass(self.processes.copy(), **kwargs)
-        completed = scheduler.run()
-
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        self.tree.delete(*self.tree.get_children())
         for p in completed:
             self.tree.insert('', 'end', values=(p.id, p.arrival_time, p.burst_time, p.priority, p.waiting_time, p.turnaround_time, p.completion_time))
 
         self.ax.clear()
-        for p in completed:
-            start = p.completion_time - p.burst_time
-            self.ax.barh(f"P{p.id}", p.burst_time, left=start)
+        # Draw every bar in one barh call rather than one artist call per process
+        widths = np.array([p.burst_time for p in completed])
+        starts = np.array([p.completion_time for p in completed]) - widths
+        rows = np.arange(len(completed))
+        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']  # one color per process, as before
+        self.ax.barh(rows, widths, left=starts, color=[colors[row % len(colors)] for row in rows])
+        self.ax.set_yticks(rows, labels=[f"P{p.id}" for p in completed])
         self.ax.set_xlabel("Time")
         self.ax.set_title(f"Gantt Chart - {scheduler_name}")
         self.canvas.draw()
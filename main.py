@@ -2,21 +2,30 @@
 
 import os
 import sys
-import random
-import time
+import threading
 import io
-import copy
-from typing import List, Dict
-from contextlib import redirect_stdout
+import importlib
+import importlib.util
+import csv
+import argparse
+import hashlib
+import json
+import sqlite3
+import time
+from typing import List, Dict, Optional, Union
+from collections import OrderedDict
+from operator import attrgetter
+from itertools import islice, starmap
+from contextlib import closing, contextmanager, nullcontext, redirect_stdout
 import uuid
 
-# Import the scheduling algorithms and Process class
+import numpy as np
+import pandas as pd
+
+# Import the Process class (scheduling algorithms are imported on first use)
 from ProcessClass.process import Process
-from schedulers.FCFS import FCFSScheduler
-from schedulers.SJF import SJFScheduler
-from schedulers.PrioritySchedule import PriorityScheduler
-from schedulers.RR import RoundRobinScheduler
-from schedulers.RR_Priority import PriorityRoundRobinScheduler
+from ProcessClass.process_table import ProcessTable
+from utils.file_io import write_execution_csv
 
 # Import matplotlib for optional PNG output
 import matplotlib
@@ -24,89 +33,174 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 
-# Define scheduler types
+# Define scheduler types ("class" is a "module:ClassName" path resolved lazily)
 SCHEDULERS = {
     "fcfs": {
         "name": "First Come First Serve",
-        "class": FCFSScheduler,
+        "class": "schedulers.FCFS:FCFSScheduler",
         "params": [],
         "description": "Non-preemptive scheduler that executes processes in the order they arrive."
     },
     "sjf": {
         "name": "Shortest Job First",
-        "class": SJFScheduler,
+        "class": "schedulers.SJF:SJFScheduler",
         "params": [],
         "description": "Non-preemptive scheduler that selects the process with the shortest burst time."
     },
     "priority": {
         "name": "Priority Scheduling",
-        "class": PriorityScheduler,
+        "class": "schedulers.PrioritySchedule:PriorityScheduler",
         "params": [],
         "description": "Non-preemptive scheduler that selects the process with the highest priority (lowest value)."
     },
     "rr": {
         "name": "Round Robin",
-        "class": RoundRobinScheduler,
+        "class": "schedulers.RR:RoundRobinScheduler",
         "params": ["time_quantum"],
         "description": "Preemptive scheduler that allocates each process a fixed time quantum."
     },
     "rrp": {
         "name": "Round Robin with Priority",
-        "class": PriorityRoundRobinScheduler,
+        "class": "schedulers.RR_Priority:PriorityRoundRobinScheduler",
         "params": ["time_quantum"],
         "description": "Preemptive scheduler combining priority with Round Robin."
     }
 }
 
-class OutputTee:
-    def __init__(self, terminal, buffer):
-        self.terminal = terminal
-        self.buffer = buffer
-
-    def write(self, message):
-        self.terminal.write(message)
-        self.buffer.write(message)
-    
-    def flush(self):
-        self.terminal.flush()
-        self.buffer.flush()
+# Menu numbering and display names derived from SCHEDULERS once at import
+SCHEDULER_KEYS = tuple(SCHEDULERS)
+SCHEDULER_NAMES = {key: info["name"] for key, info in SCHEDULERS.items()}
+COMPARE_CHOICE = len(SCHEDULERS) + 1
+EXIT_CHOICE = len(SCHEDULERS) + 2
+
+# Separator lines and table headings shared by every screen
+SEP50 = "-" * 50
+SEP60 = "-" * 60
+SEP70 = "-" * 70
+SEP80 = "-" * 80
+EQ80 = "=" * 80
+PROCESS_TABLE_HEADING = f"{'ID':<5} {'Burst':<8} {'Priority':<10} {'Arrival':<10}"
+RESULT_TABLE_HEADING = (f"{'ID':<5} {'Arrival':<6} {'Burst':<7} {'Priority':<6} "
+                        f"{'Waiting':<7} {'Turnaround':<7} {'Completion':<7}")
+COMPARISON_TABLE_HEADING = f"{'Algorithm':<20} {'Avg Wait':<12} {'Avg Turn':<12} {'Max Comp':<12}"
+
+# Header and menu text never change, so they are rendered once at import
+_HEADER_TEXT = f"\n{EQ80}\n{'CPU SCHEDULING ALGORITHM VISUALIZER'.center(80)}\n{EQ80}\n"
+_MENU_TEXT = "\n".join(
+    ["\nAvailable Scheduling Algorithms:", SEP50]
+    + [line for idx, (key, value) in enumerate(SCHEDULERS.items(), 1)
+       for line in (f"{idx}. {value['name']} ({key})", f"   {value['description']}")]
+    + ["\nOther Options:",
+       f"{COMPARE_CHOICE}. Compare All Algorithms",
+       f"{EXIT_CHOICE}. Exit",
+       "Or type 'q' to quit",
+       SEP50]) + "\n"
+
+# C-level sort key for ordering processes by id
+by_id = attrgetter('id')
+
+# Row templates bound once and reused for every process
+format_process_row = "{:<5} {:<8} {:<10} {:<10}".format
+format_process_csv = "{},{},{},{}".format
+format_result_row = "{:<5} {:<6} {:<7} {:<6} {:<7} {:<7} {:<7}\n".format
+format_comparison_row = "{:<20} {:<12.2f} {:<12.2f} {:<12}\n".format
+
+# Columns of the per-run schedule CSV, in file order, and a C-level getter for one row
+SCHEDULE_CSV_COLUMNS = ("id", "arrival_time", "burst_time", "priority",
+                        "waiting_time", "turnaround_time", "completion_time")
+schedule_csv_row = attrgetter(*SCHEDULE_CSV_COLUMNS)
+
+# Every frame of the progress bar animation, rendered once
+PROGRESS_BAR_LENGTH = 30
+PROGRESS_FRAMES = tuple(f"\rRunning scheduler [{'█' * filled}{'-' * (PROGRESS_BAR_LENGTH - filled)}]"
+                        for filled in range(PROGRESS_BAR_LENGTH + 1))
+
+# Buffer size for process CSV reads and writes (large enough to batch syscalls)
+FILE_BUFFER_SIZE = 1 << 20
+
+# Files with more rows than this stay as a ProcessTable instead of Process objects
+LARGE_FILE_ROWS = 10_000
+
+# Shared generator for unseeded random process generation
+_rng = np.random.default_rng()
+
+# Scheduler classes already imported by get_scheduler_class
+_scheduler_classes = {}
+
+# Memoized scheduler runs, keyed by algorithm, parameters and input processes (LRU)
+RUN_CACHE_SIZE = 32
+_run_cache = OrderedDict()
+
+# Opt-in on-disk memo of full comparisons, shared across sessions (enable with --cache)
+COMPARISON_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cpu_scheduler_cache.sqlite")
+COMPARISON_CACHE_SIZE = 64
+COMPARISON_CACHE_FORMAT = 3  # bump when the layout of the stored payload changes
+# Modules besides the schedulers whose code shapes the results; their sources are part of every cache key
+COMPARISON_CACHE_MODULES = ("ProcessClass.process", "utils.gantt_chart")
+_comparison_cache_enabled = False
+_scheduler_sources_digest = None
+
+# Comparison figures kept open between runs, keyed by number of subplots
+_comparison_figures = {}
+
+# Column layout of the per-run "timings" array stored in the metrics
+TIMING_ID, TIMING_BURST, TIMING_WAITING, TIMING_TURNAROUND, TIMING_COMPLETION = range(5)
+
+@contextmanager
+def captured(buffer: Optional[io.StringIO], stream):
+    """Collect prints in `buffer`, then copy the newly captured text to `stream` in one write.
+
+    With no buffer (nothing will be saved) prints go straight to `stream`.
+    """
+    if buffer is None:
+        with redirect_stdout(stream):
+            yield
+        return
+    start = buffer.tell()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        stream.write(buffer.getvalue()[start:])
 
 # =============================================
 # Terminal Related Functions
 # =============================================
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+        return
+    # Same escape sequence `clear` emits, without spawning a shell
+    sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+    sys.stdout.flush()
 
 def print_header():
-    print(f"\n{'=' * 80}")
-    print(f"CPU SCHEDULING ALGORITHM VISUALIZER".center(80))
-    print(f"{'=' * 80}")
+    sys.stdout.write(_HEADER_TEXT)
 
 def print_menu():
-    print(f"\nAvailable Scheduling Algorithms:")
-    print("-" * 50)
-    for idx, (key, value) in enumerate(SCHEDULERS.items(), 1):
-        print(f"{idx}. {value['name']} ({key})")
-        print(f"   {value['description']}")
-    print(f"\nOther Options:")
-    print(f"{len(SCHEDULERS) + 1}. Compare All Algorithms")
-    print(f"{len(SCHEDULERS) + 2}. Exit")
-    print(f"Or type 'q' to quit")
-    print("-" * 50)
-
-def progress_bar(seconds: int):
-    bar_length = 30
-    start_time = time.time()
-    while time.time() - start_time < seconds:
-        elapsed = time.time() - start_time
-        progress = elapsed / seconds
-        filled = int(bar_length * progress)
-        bar = '█' * filled + '-' * (bar_length - filled)
-        sys.stdout.write(f'\rRunning scheduler [{bar}] {int(progress * 100)}%')
-        sys.stdout.flush()
-        time.sleep(0.1)
-    sys.stdout.write(f'\rScheduler completed!{" " * 50}\n')
+    sys.stdout.write(_MENU_TEXT)
+
+def progress_bar(stop: threading.Event, stream):
+    """Animate the progress bar on `stream` until `stop` is set."""
+    position = 0
+    while not stop.wait(0.1):
+        stream.write(PROGRESS_FRAMES[position % len(PROGRESS_FRAMES)])
+        stream.flush()
+        position += 1
+    stream.write(f'\rScheduler completed!{" " * 50}\n')
+
+@contextmanager
+def show_progress(stream):
+    """Display the progress bar only for as long as the wrapped block runs."""
+    stop = threading.Event()
+    spinner = threading.Thread(target=progress_bar, args=(stop, stream), daemon=True)
+    spinner.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        spinner.join()
  
 # ============================================
 # Scanner Functions (Input Functions)
@@ -115,9 +209,9 @@ def progress_bar(seconds: int):
 def get_int_input(prompt: str, min_val: int = None, max_val: int = None) -> int:
     while True:
         try:
-            value = input(f"{prompt}").strip()
+            value = input(prompt).strip()
             if value.lower() in ['q', 'quit']:
-                print(f"\nExiting program. Goodbye!")
+                print("\nExiting program. Goodbye!")
                 sys.exit(0)
             value = int(value)
             if min_val is not None and value < min_val:
@@ -128,15 +222,31 @@ def get_int_input(prompt: str, min_val: int = None, max_val: int = None) -> int:
                 continue
             return value
         except ValueError:
-            print(f"Please enter a valid integer or 'q' to quit.")
+            print("Please enter a valid integer or 'q' to quit.")
 
 def get_string_input(prompt: str) -> str:
-    value = input(f"{prompt}").strip()
+    value = input(prompt).strip()
     if value.lower() in ['q', 'quit']:
-        print(f"\nExiting program. Goodbye!")
+        print("\nExiting program. Goodbye!")
         sys.exit(0)
     return value
 
+def get_process_fields(prompt: str) -> tuple:
+    while True:
+        value = get_string_input(prompt)
+        try:
+            burst_time, priority, arrival_time = (int(field) for field in value.split(','))
+        except ValueError:
+            print("Please enter three integers separated by commas or 'q' to quit.")
+            continue
+        if burst_time < 1 or priority < 1:
+            print("Burst time and priority must be at least 1.")
+            continue
+        if arrival_time < 0:
+            print("Arrival time must be at least 0.")
+            continue
+        return burst_time, priority, arrival_time
+
 def get_scheduler_params(scheduler_type: str) -> dict:
     params = {}
     for param in SCHEDULERS[scheduler_type]["params"]:
@@ -147,7 +257,7 @@ def get_scheduler_params(scheduler_type: str) -> dict:
     return params
 
 def process_input_options():
-    print(f"\nProcess Input Options:")
+    print("\nProcess Input Options:")
     print("1. Generate random processes")
     print("2. Enter processes manually")
     print("3. Load processes from file")
@@ -161,7 +271,7 @@ def process_input_options():
 def generate_random_processes() -> List[Process]:
     num_processes = get_int_input("Number of processes [1-20]: ", 1, 20)
     use_seed = get_string_input("Use random seed? (y/n): ").lower() == 'y'
-    seed = get_int_input("Enter seed value: ") if use_seed else None
+    seed = get_int_input("Enter seed value [0+]: ", 0) if use_seed else None
     
     min_burst = get_int_input("Minimum burst time [1+]: ", 1)
     max_burst = get_int_input("Maximum burst time: ", min_burst)
@@ -170,67 +280,80 @@ def generate_random_processes() -> List[Process]:
     min_arrival = get_int_input("Minimum arrival time [0+]: ", 0)
     max_arrival = get_int_input("Maximum arrival time: ", min_arrival)
 
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed) if seed is not None else _rng
 
-    return [Process(
-        id=i,
-        burst_time=random.randint(min_burst, max_burst),
-        priority=random.randint(min_priority, max_priority),
-        arrival_time=random.randint(min_arrival, max_arrival)
-    ) for i in range(1, num_processes + 1)]
+    # Draw every column in one batch instead of one randint call per field
+    bursts = rng.integers(min_burst, max_burst + 1, num_processes)
+    priorities = rng.integers(min_priority, max_priority + 1, num_processes)
+    arrivals = rng.integers(min_arrival, max_arrival + 1, num_processes)
+
+    return ProcessTable.from_columns(np.arange(1, num_processes + 1), bursts, priorities, arrivals).to_list()
 
 def enter_processes_manually() -> List[Process]:
     num_processes = get_int_input("Number of processes [1+]: ", 1)
     processes = []
+    print("\nEnter each process as burst,priority,arrival (e.g. 5,2,0)")
     for i in range(1, num_processes + 1):
-        print(f"\nProcess {i}:")
-        burst_time = get_int_input("Burst time [1+]: ", 1)
-        priority = get_int_input("Priority [1+]: ", 1)
-        arrival_time = get_int_input("Arrival time [0+]: ", 0)
+        burst_time, priority, arrival_time = get_process_fields(f"Process {i} [burst 1+, priority 1+, arrival 0+]: ")
         processes.append(Process(id=i, burst_time=burst_time, priority=priority, arrival_time=arrival_time))
     return processes
 
-def load_processes_from_file() -> List[Process]:
-    """Load processes from a CSV file, skipping header row if present."""
+def parse_process_rows(file, start_line: int) -> List[Process]:
+    """Parse CSV rows one by one, reporting and skipping malformed rows."""
+    processes = []
+    rows = islice(csv.reader(file), start_line, None)
+    for line_num, parts in enumerate(rows, start_line + 1):
+        try:
+            if len(parts) < 4:
+                print(f"Line {line_num}: Insufficient data - skipping")
+                continue
+            
+            processes.append(Process(
+                id=int(parts[0]),
+                burst_time=int(parts[1]),
+                priority=int(parts[2]),
+                arrival_time=int(parts[3])
+            ))
+        except ValueError as e:
+            print(f"Error parsing line {line_num}: {e}")
+            continue
+    return processes
+
+def load_processes_from_file() -> Union[List[Process], ProcessTable]:
+    """Load processes from a CSV file, skipping header row if present.
+
+    Files larger than LARGE_FILE_ROWS are returned as a ProcessTable, which
+    builds Process objects only when a row is accessed.
+    """
     filename = get_string_input("Enter the CSV file path: ")
 
     try:
-        processes = []
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-            if not lines:
+        # One buffered handle serves the header check, the fast path and the fallback
+        with open(filename, 'r', newline='', buffering=FILE_BUFFER_SIZE) as file:
+            first_line = file.readline()
+            if not first_line:
                 print("File is empty.")
                 return None
             
             # Check for header row
             start_line = 0
-            first_line = lines[0].strip().split(',')
-            if first_line and first_line[0].lower() in ['id', 'pid']:
+            first_fields = first_line.strip().split(',')
+            if first_fields and first_fields[0].lower() in ['id', 'pid']:
                 print("Skipping header row.")
                 start_line = 1
             
-            for line_num, line in enumerate(lines[start_line:], start_line + 1):
-                try:
-                    parts = line.strip().split(',')
-                    if len(parts) < 4:
-                        print(f"Line {line_num}: Insufficient data - skipping")
-                        continue
-                    
-                    proc_id = int(parts[0])
-                    burst_time = int(parts[1])
-                    priority = int(parts[2])
-                    arrival_time = int(parts[3])
-                    
-                    processes.append(Process(
-                        id=proc_id,
-                        burst_time=burst_time,
-                        priority=priority,
-                        arrival_time=arrival_time
-                    ))
-                except (ValueError, IndexError) as e:
-                    print(f"Error parsing line {line_num}: {e}")
-                    continue
+            try:
+                # Fast path: let pandas' C parser tokenize and convert the whole file at once
+                file.seek(0)
+                rows = pd.read_csv(file, header=None, skiprows=start_line, usecols=range(4),
+                                   dtype=np.int64, engine='c').to_numpy()
+                processes = ProcessTable.from_columns(*rows.T)
+                if len(processes) <= LARGE_FILE_ROWS:
+                    processes = processes.to_list()
+            except ValueError:
+                # Malformed rows: rewind and fall back to the tolerant line-by-line parser
+                file.seek(0)
+                processes = parse_process_rows(file, start_line)
         
         if not processes:
             print("No valid processes found in file.")
@@ -248,108 +371,148 @@ def load_processes_from_file() -> List[Process]:
 
 def save_processes_to_file(processes: List[Process]):
     if not processes:
-        print(f"No processes to save.")
+        print("No processes to save.")
         return
     filename = get_string_input("Enter filename (CSV): ") + ".csv"
     try:
-        with open(filename, 'w') as file:
-            file.write("id,burst_time,priority,arrival_time\n")
-            for p in processes:
-                file.write(f"{p.id},{p.burst_time},{p.priority},{p.arrival_time}\n")
+        body = "\n".join(format_process_csv(p.id, p.burst_time, p.priority, p.arrival_time) for p in processes)
+        with open(filename, 'w', buffering=FILE_BUFFER_SIZE) as file:
+            file.write(f"{','.join(ProcessTable.INPUT_COLUMNS)}\n{body}\n")
         print(f"Successfully saved {len(processes)} processes to {filename}")
     except Exception as e:
         print(f"Error saving file: {e}")
 
-def display_processes(processes: List[Process]):
+def display_processes(processes: Union[List[Process], ProcessTable]):
     if not processes:
-        print(f"No processes to display.")
+        print("No processes to display.")
         return
-    print(f"\nProcess List:")
-    print("-" * 60)
-    print(f"{'ID':<5} {'Burst':<8} {'Priority':<10} {'Arrival':<10}")
-    print("-" * 60)
-    for p in sorted(processes, key=lambda x: x.id):
-        print(f"{p.id:<5} {p.burst_time:<8} {p.priority:<10} {p.arrival_time:<10}")
-    print("-" * 60)
+    if isinstance(processes, ProcessTable):
+        # Order the columns with one argsort instead of walking objects
+        order = np.argsort(processes.id, kind='stable')
+        rows = zip(*(getattr(processes, column)[order].tolist() for column in ProcessTable.INPUT_COLUMNS))
+    else:
+        rows = ((p.id, p.burst_time, p.priority, p.arrival_time) for p in sorted(processes, key=by_id))
+    lines = ["\nProcess List:", SEP60, PROCESS_TABLE_HEADING, SEP60]
+    lines.extend(starmap(format_process_row, rows))
+    lines.append(SEP60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # =============================================
 # Scheduler Execution Functions
 # =============================================
 
-def run_scheduler(scheduler_type: str, processes: List[Process], params: dict):
+def get_scheduler_class(scheduler_type: str):
+    """Import the scheduler class on first use and cache it."""
+    scheduler_class = _scheduler_classes.get(scheduler_type)
+    if scheduler_class is None:
+        module_name, class_name = SCHEDULERS[scheduler_type]["class"].split(":")
+        scheduler_class = getattr(importlib.import_module(module_name), class_name)
+        _scheduler_classes[scheduler_type] = scheduler_class
+    return scheduler_class
+
+def run_cached(scheduler_type: str, processes: List[Process], scheduler_params: dict):
+    """Run a scheduler, reusing the result of an identical earlier run when available."""
+    key = (scheduler_type, tuple(sorted(scheduler_params.items())),
+           tuple((p.id, p.burst_time, p.priority, p.arrival_time) for p in processes))
+    cached = _run_cache.get(key)
+    if cached is not None:
+        _run_cache.move_to_end(key)
+        write_execution_csv(cached[0].gantt_chart)  # keep the exported timeline in sync with this run
+        return cached
+
+    scheduler = get_scheduler_class(scheduler_type)(processes, **scheduler_params)
+    _run_cache[key] = scheduler, scheduler.run()
+    if len(_run_cache) > RUN_CACHE_SIZE:
+        _run_cache.popitem(last=False)
+    return _run_cache[key]
+
+def select_params(scheduler_type: str, params: dict) -> dict:
+    """Keep only the parameters the given scheduler declares in SCHEDULERS."""
+    return {name: params[name] for name in SCHEDULERS[scheduler_type]["params"] if name in params}
+
+def take_snapshot(processes: Union[List[Process], ProcessTable]) -> ProcessTable:
+    """Freeze the input columns once; every run then starts from fresh processes built from it."""
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_columns(*zip(*((p.id, p.burst_time, p.priority, p.arrival_time) for p in processes)))
+
+def run_scheduler(scheduler_type: str, processes: Union[List[Process], ProcessTable], params: dict):
     if not processes:
-        print(f"No processes to schedule.")
+        print("No processes to schedule.")
         return None
+    if isinstance(processes, ProcessTable):
+        processes = processes.new_processes()
 
-    scheduler_output = io.StringIO()
     original_stdout = sys.stdout
-    scheduler_class = SCHEDULERS[scheduler_type]["class"]
-    scheduler_name = SCHEDULERS[scheduler_type]["name"]
+    scheduler_name = SCHEDULER_NAMES[scheduler_type]
     
     print(f"\nRunning {scheduler_name}...")
-    scheduler_params = {k: v for k, v in params.items() if k in SCHEDULERS[scheduler_type]["params"]}
+    scheduler_params = select_params(scheduler_type, params)
     is_interactive = params.get("interactive", True)
+    # Only an interactive run can be saved to a text file, so only it needs a copy of the output
+    scheduler_output = io.StringIO() if is_interactive else None
 
-    scheduler = scheduler_class(processes, **scheduler_params) if scheduler_params else scheduler_class(processes)
-    
-    progress_bar(2 if is_interactive else 1)
-    
-    sys.stdout = OutputTee(original_stdout, scheduler_output)
-    completed_processes = scheduler.run()
+    # The comparison loop runs every algorithm back to back; only interactive runs animate
+    with show_progress(original_stdout) if is_interactive else nullcontext():
+        scheduler, completed_processes = run_cached(scheduler_type, processes, scheduler_params)
+    completed_by_id = sorted(completed_processes, key=by_id)  # shared by the details table and the CSV export
     
-    avg_waiting_time = sum(p.waiting_time for p in completed_processes) / len(completed_processes)
-    avg_turnaround_time = sum(p.turnaround_time for p in completed_processes) / len(completed_processes)
-    max_completion_time = max(p.completion_time for p in completed_processes)
+    # One pass over the processes; the reductions then run on the array
+    timings = np.array([(p.id, p.burst_time, p.waiting_time, p.turnaround_time, p.completion_time)
+                        for p in completed_processes], dtype=np.int64)
+    avg_waiting_time, avg_turnaround_time = timings[:, TIMING_WAITING:TIMING_COMPLETION].mean(axis=0).tolist()
+    max_completion_time = int(timings[:, TIMING_COMPLETION].max())
     
     metrics = {
         "avg_waiting_time": avg_waiting_time,
         "avg_turnaround_time": avg_turnaround_time,
         "max_completion_time": max_completion_time,
-        "completed_processes": completed_processes
+        "completed_processes": completed_processes,
+        "timings": timings,
+        "gantt_chart": scheduler.gantt_chart,
+        "params": scheduler_params
     }
 
-    print(f"\n{'='*80}")
-    print(f"Results: {scheduler_name}".center(80))
-    print(f"{'='*80}\n")
+    with captured(scheduler_output, original_stdout):
+        print(f"\n{EQ80}")
+        print(f"Results: {scheduler_name}".center(80))
+        print(f"{EQ80}\n")
     
-    print(f"Process Details:")
-    print("-" * 70)
-    print(f"{'ID':<5} {'Arrival':<6} {'Burst':<7} {'Priority':<6} {'Waiting':<7} {'Turnaround':<7} {'Completion':<7}")
-    print("-" * 70)
-    for p in sorted(completed_processes, key=lambda x: x.id):
-        print(f"{p.id:<5} {p.arrival_time:<6} {p.burst_time:<7} {p.priority:<6} "
-              f"{p.waiting_time:<7} {p.turnaround_time:<7} {p.completion_time:<7}")
-    print("-" * 70)
-
-    print(f"\nStatistics:")
-    print("-" * 50)
-    print(f"Avg Waiting Time   : {avg_waiting_time:.2f} units")
-    print(f"Avg Turnaround Time: {avg_turnaround_time:.2f} units")
-    print(f"Total Execution    : {max_completion_time} units")
-    print(f"Throughput         : {(len(completed_processes)/max_completion_time):.4f} processes/unit")
-    print(f"CPU Utilization    : {scheduler.calculate_cpu_usage():.2f} %")
-    print("-" * 50)
-
-    sys.stdout = original_stdout
+        print("Process Details:")
+        print(SEP70)
+        print(RESULT_TABLE_HEADING)
+        print(SEP70)
+        # One write for the whole table instead of one print per process
+        sys.stdout.write("".join(format_result_row(p.id, p.arrival_time, p.burst_time, p.priority,
+                                                   p.waiting_time, p.turnaround_time, p.completion_time)
+                                 for p in completed_by_id))
+        print(SEP70)
+
+        print("\nStatistics:")
+        print(SEP50)
+        print(f"Avg Waiting Time   : {avg_waiting_time:.2f} units")
+        print(f"Avg Turnaround Time: {avg_turnaround_time:.2f} units")
+        print(f"Total Execution    : {max_completion_time} units")
+        print(f"Throughput         : {(len(completed_processes)/max_completion_time):.4f} processes/unit")
+        print(f"CPU Utilization    : {scheduler.calculate_cpu_usage():.2f} %")
+        print(SEP50)
     
     if is_interactive:
         if get_string_input("\nShow Gantt chart? (y/n): ").lower() == 'y':
-            sys.stdout = OutputTee(original_stdout, scheduler_output)
-            scheduler.print_gantt_chart()
-            sys.stdout = original_stdout
+            with captured(scheduler_output, original_stdout):
+                scheduler.print_gantt_chart()
 
         if get_string_input("Show execution log? (y/n): ").lower() == 'y':
-            sys.stdout = OutputTee(original_stdout, scheduler_output)
-            scheduler.print_execution_log()
-            sys.stdout = original_stdout
+            with captured(scheduler_output, original_stdout):
+                scheduler.print_execution_log()
 
         if get_string_input("Save schedule to CSV? (y/n): ").lower() == 'y':
             filename = get_string_input("Filename (no .csv): ") + ".csv"
             try:
-                with open(filename, 'w') as f:
-                    f.write("id,arrival_time,burst_time,priority,waiting_time,turnaround_time,completion_time\n")
-                    for p in sorted(completed_processes, key=lambda x: x.id):
-                        f.write(f"{p.id},{p.arrival_time},{p.burst_time},{p.priority},{p.waiting_time},{p.turnaround_time},{p.completion_time}\n")
+                with open(filename, 'w', newline='', buffering=FILE_BUFFER_SIZE) as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(SCHEDULE_CSV_COLUMNS)
+                    writer.writerows(map(schedule_csv_row, completed_by_id))
                 print(f"Saved to {filename}")
             except Exception as e:
                 print(f"Error saving file: {e}")
@@ -363,7 +526,7 @@ def run_scheduler(scheduler_type: str, processes: List[Process], params: dict):
             except Exception as e:
                 print(f"Error saving file: {e}")
 
-        input(f"\nPress Enter to continue...")
+        input("\nPress Enter to continue...")
     
     return metrics
 
@@ -371,60 +534,155 @@ def run_scheduler(scheduler_type: str, processes: List[Process], params: dict):
 # Comparison of Algorithms
 # =============================================
 
-def compare_all_schedulers(processes: List[Process]):
+def get_comparison_figure(rows: int):
+    """Return a cleared (figure, axes) pair with `rows` subplots, reusing the one from earlier comparisons."""
+    cached = _comparison_figures.get(rows)
+    if cached is None:
+        fig, axes = plt.subplots(rows, 1, figsize=(10, 2 * rows))
+        if rows == 1:
+            axes = [axes]
+        cached = _comparison_figures[rows] = fig, axes
+    for ax in cached[1]:
+        ax.clear()
+    return cached
+
+def scheduler_sources_digest() -> bytes:
+    """Hash the source files of the schedulers and the modules they depend on (computed once per session)."""
+    global _scheduler_sources_digest
+    if _scheduler_sources_digest is None:
+        modules = [info["class"].split(":")[0] for info in SCHEDULERS.values()] + list(COMPARISON_CACHE_MODULES)
+        digest = hashlib.blake2b(digest_size=16)
+        for module_name in modules:
+            # find_spec locates the file without importing the scheduler
+            with open(importlib.util.find_spec(module_name).origin, 'rb') as f:
+                digest.update(f.read())
+        _scheduler_sources_digest = digest.digest()
+    return _scheduler_sources_digest
+
+def comparison_cache_key(snapshot: ProcessTable, time_quantum: int) -> str:
+    """Hash the input columns (in order), the time quantum and the scheduler sources into a stable cache key.
+
+    Any edit to a scheduler changes the key, so results saved by older code never match.
+    """
+    digest = hashlib.blake2b(snapshot.stack().tobytes(), digest_size=16)
+    digest.update(f"{COMPARISON_CACHE_FORMAT}:{time_quantum}".encode())
+    digest.update(scheduler_sources_digest())
+    return digest.hexdigest()
+
+def open_comparison_cache() -> sqlite3.Connection:
+    """Open the comparison cache database, creating its table on first use."""
+    db = sqlite3.connect(COMPARISON_CACHE_PATH)
+    db.execute("CREATE TABLE IF NOT EXISTS comparisons (key TEXT PRIMARY KEY, metrics TEXT, used REAL)")
+    return db
+
+def load_cached_comparison(key: str) -> Optional[tuple]:
+    """Return the (metrics, execution rows) of an earlier identical comparison, or None on a miss."""
+    try:
+        with closing(open_comparison_cache()) as db, db:
+            row = db.execute("SELECT metrics FROM comparisons WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE comparisons SET used = ? WHERE key = ?", (time.time(), key))
+    except sqlite3.Error:
+        return None
+    payload = json.loads(row[0])
+    all_metrics = payload["metrics"]
+    for metrics in all_metrics.values():
+        metrics["timings"] = np.array(metrics["timings"], dtype=np.int64)
+    return all_metrics, payload["execution"]
+
+def store_comparison(key: str, all_metrics: Dict[str, dict]):
+    """Persist the numbers a comparison displays, keeping only the most recently used entries.
+
+    The execution rows of the last scheduler are stored too, since its run is the one
+    that leaves static/csv/execution.csv behind.
+    """
+    fields = ("avg_waiting_time", "avg_turnaround_time", "max_completion_time")
+    last_metrics = next(reversed(all_metrics.values()))
+    payload = json.dumps({
+        "metrics": {scheduler_type: {**{field: metrics[field] for field in fields},
+                                     "timings": metrics["timings"].tolist()}
+                    for scheduler_type, metrics in all_metrics.items()},
+        "execution": list(last_metrics["gantt_chart"].process_rows())
+    })
+    try:
+        with closing(open_comparison_cache()) as db, db:
+            db.execute("INSERT OR REPLACE INTO comparisons VALUES (?, ?, ?)", (key, payload, time.time()))
+            db.execute("DELETE FROM comparisons WHERE key NOT IN "
+                       "(SELECT key FROM comparisons ORDER BY used DESC LIMIT ?)", (COMPARISON_CACHE_SIZE,))
+    except sqlite3.Error:
+        pass  # the cache is an optimization only
+
+def compare_all_schedulers(processes: Union[List[Process], ProcessTable], prewarmed: tuple = None):
+    """Run every scheduler on the same processes and compare their metrics.
+
+    `prewarmed` is an optional (scheduler_type, metrics) pair from a run the user just made;
+    it is reused instead of running that scheduler again when its parameters match.
+    """
     if not processes:
-        print(f"No processes to schedule.")
+        print("No processes to schedule.")
         return
     
-    print(f"\nComparing all scheduling algorithms...")
+    print("\nComparing all scheduling algorithms...")
     all_metrics = {}
+    snapshot = take_snapshot(processes)
     
     time_quantum = get_int_input("Time quantum for Round Robin [default=2]: ", 1) or 2
-    params_store = {
-        "rr": {"time_quantum": time_quantum},
-        "rrp": {"time_quantum": time_quantum}
-    }
+    # run_scheduler only passes each algorithm the parameters it declares, so one dict serves them all
+    params = {"time_quantum": time_quantum, "interactive": False}
     
-    for scheduler_type, scheduler_info in SCHEDULERS.items():
-        params = params_store.get(scheduler_type, {}).copy()
-        params["interactive"] = False
-        try:
-            metrics = run_scheduler(scheduler_type, [p.copy() for p in processes], params)
-            if metrics:
-                all_metrics[scheduler_type] = metrics
-        except Exception as e:
-            print(f"Error running {scheduler_info['name']}: {e}")
+    cache_key = comparison_cache_key(snapshot, time_quantum) if _comparison_cache_enabled else None
+    cached = load_cached_comparison(cache_key) if cache_key else None
+    if cached:
+        print("Using saved results of an identical earlier comparison.")
+        all_metrics, execution_rows = cached
+        write_execution_csv(execution_rows)  # leave the same timeline file a full comparison would
+    else:
+        for scheduler_type, scheduler_info in SCHEDULERS.items():
+            if prewarmed and prewarmed[0] == scheduler_type \
+                    and prewarmed[1]["params"] == select_params(scheduler_type, params):
+                all_metrics[scheduler_type] = prewarmed[1]
+                write_execution_csv(prewarmed[1]["gantt_chart"])  # as if this scheduler had just run
+                continue
+            try:
+                metrics = run_scheduler(scheduler_type, snapshot, params)
+                if metrics:
+                    all_metrics[scheduler_type] = metrics
+            except Exception as e:
+                print(f"Error running {scheduler_info['name']}: {e}")
+        if cache_key and len(all_metrics) == len(SCHEDULERS):
+            store_comparison(cache_key, all_metrics)
     
     clear_screen()
     print_header()
-    print(f"\nPerformance Comparison")
-    print("=" * 80)
-    print(f"{'Algorithm':<20} {'Avg Wait':<12} {'Avg Turn':<12} {'Max Comp':<12}")
-    print("-" * 80)
-    for scheduler_type, metrics in all_metrics.items():
-        name = SCHEDULERS[scheduler_type]["name"][:18]
-        print(f"{name:<20} {metrics['avg_waiting_time']:<12.2f} {metrics['avg_turnaround_time']:<12.2f} {metrics['max_completion_time']:<12}")
-    print("-" * 80)
+    print("\nPerformance Comparison")
+    print(EQ80)
+    print(COMPARISON_TABLE_HEADING)
+    print(SEP80)
+    sys.stdout.write("".join(format_comparison_row(SCHEDULER_NAMES[scheduler_type][:18], metrics['avg_waiting_time'],
+                                                   metrics['avg_turnaround_time'], metrics['max_completion_time'])
+                             for scheduler_type, metrics in all_metrics.items()))
+    print(SEP80)
     
     if get_string_input("Save comparative Gantt chart as PNG? (y/n): ").lower() == 'y':
         try:
-            fig, axes = plt.subplots(len(all_metrics), 1, figsize=(10, 2 * len(all_metrics)))
-            if len(all_metrics) == 1:
-                axes = [axes]
+            fig, axes = get_comparison_figure(len(all_metrics))
+            colors = plt.rcParams['axes.prop_cycle'].by_key()['color']  # one color per process, as before
             for i, (scheduler_type, metrics) in enumerate(all_metrics.items()):
                 ax = axes[i]
-                name = SCHEDULERS[scheduler_type]["name"]
-                for p in metrics["completed_processes"]:
-                    if p.completion_time is not None:
-                        start_time = p.completion_time - p.burst_time
-                        ax.barh(f"P{p.id}", p.burst_time, left=start_time, height=0.4)
-                ax.set_title(f"{name}")
+                name = SCHEDULER_NAMES[scheduler_type]
+                # One barh call per subplot, straight from the run's timings array
+                timings = metrics["timings"]
+                bursts = timings[:, TIMING_BURST]
+                ax.barh([f"P{pid}" for pid in timings[:, TIMING_ID].tolist()], bursts,
+                        left=timings[:, TIMING_COMPLETION] - bursts, height=0.4,
+                        color=[colors[row % len(colors)] for row in range(len(timings))])
+                ax.set_title(name)
                 ax.set_xlabel("Time")
                 ax.grid(True, alpha=0.3)
-            plt.tight_layout()
+            fig.tight_layout()
             plot_filename = f"gantt_comparison_{uuid.uuid4().hex[:8]}.png"
-            plt.savefig(plot_filename, bbox_inches='tight')
-            plt.close()
+            fig.savefig(plot_filename, bbox_inches='tight')
             print(f"Comparative Gantt chart saved as {plot_filename}")
         except Exception as e:
             print(f"Error generating plot: {e}")
@@ -432,16 +690,16 @@ def compare_all_schedulers(processes: List[Process]):
     if get_string_input("Save comparison to CSV? (y/n): ").lower() == 'y':
         filename = get_string_input("Filename (no .csv): ") + ".csv"
         try:
+            rows = "".join(f"{SCHEDULER_NAMES[scheduler_type]},{metrics['avg_waiting_time']:.2f},"
+                           f"{metrics['avg_turnaround_time']:.2f},{metrics['max_completion_time']}\n"
+                           for scheduler_type, metrics in all_metrics.items())
             with open(filename, 'w') as f:
-                f.write("Algorithm,Avg Waiting Time,Avg Turnaround Time,Max Completion Time\n")
-                for scheduler_type, metrics in all_metrics.items():
-                    name = SCHEDULERS[scheduler_type]["name"]
-                    f.write(f"{name},{metrics['avg_waiting_time']:.2f},{metrics['avg_turnaround_time']:.2f},{metrics['max_completion_time']}\n")
+                f.write(f"Algorithm,Avg Waiting Time,Avg Turnaround Time,Max Completion Time\n{rows}")
             print(f"Saved comparison to {filename}")
         except Exception as e:
             print(f"Error saving file: {e}")
     
-    input(f"\nPress Enter to continue...")
+    input("\nPress Enter to continue...")
 
 # =============================================
 # Main Function
@@ -449,6 +707,7 @@ def compare_all_schedulers(processes: List[Process]):
 
 def main():
     processes = None
+    snapshot = None
     while True:
         clear_screen()
         print_header()
@@ -458,29 +717,31 @@ def main():
             if get_string_input("View processes? (y/n): ").lower() == 'y':
                 display_processes(processes)
         else:
-            print(f"\nNo processes loaded.")
+            print("\nNo processes loaded.")
         
         print_menu()
         try:
             choice_input = get_string_input("Enter choice: ")
             if choice_input.lower() in ['q', 'quit']:
-                print(f"\nExiting program. Goodbye!")
+                print("\nExiting program. Goodbye!")
                 break
             
             choice = int(choice_input)
-            if choice == len(SCHEDULERS) + 2:
-                print(f"\nExiting program. Goodbye!")
+            if choice == EXIT_CHOICE:
+                print("\nExiting program. Goodbye!")
                 break
             
-            if choice == len(SCHEDULERS) + 1:
+            if choice == COMPARE_CHOICE:
                 if not processes:
-                    print(f"No processes loaded. Please input processes first.")
-                    input(f"Press Enter to continue...")
+                    print("No processes loaded. Please input processes first.")
+                    input("Press Enter to continue...")
                     continue
-                compare_all_schedulers([p.copy() for p in processes])
+                compare_all_schedulers(snapshot)
                 continue
             
-            scheduler_type = list(SCHEDULERS.keys())[choice - 1]
+            scheduler_type = SCHEDULER_KEYS[choice - 1]
+            # Import the chosen scheduler while the user answers the input prompts
+            threading.Thread(target=get_scheduler_class, args=(scheduler_type,), daemon=True).start()
             
             if not processes or get_string_input("Use current processes? (y/n): ").lower() != 'y':
                 input_choice = process_input_options()
@@ -498,28 +759,35 @@ def main():
                         processes = new_processes
                 elif input_choice == 4:
                     continue
+                if processes:
+                    snapshot = take_snapshot(processes)
             
             if not processes:
-                print(f"No processes available. Please input processes first.")
-                input(f"Press Enter to continue...")
+                print("No processes available. Please input processes first.")
+                input("Press Enter to continue...")
                 continue
             
             params = get_scheduler_params(scheduler_type)
             params["interactive"] = True
-            run_scheduler(scheduler_type, [p.copy() for p in processes], params)
+            metrics = run_scheduler(scheduler_type, snapshot, params)
             
             if get_string_input("Compare with other algorithms? (y/n): ").lower() == 'y':
-                compare_all_schedulers([p.copy() for p in processes])
+                compare_all_schedulers(snapshot, prewarmed=(scheduler_type, metrics) if metrics else None)
             
         except ValueError:
-            print(f"Invalid input. Please enter a number or 'q' to quit.")
-            input(f"Press Enter to continue...")
+            print("Invalid input. Please enter a number or 'q' to quit.")
+            input("Press Enter to continue...")
         except KeyboardInterrupt:
-            print(f"Operation cancelled by user.")
-            input(f"Press Enter to continue...")
+            print("Operation cancelled by user.")
+            input("Press Enter to continue...")
         except Exception as e:
             print(f"An error occurred: {e}")
-            input(f"Press Enter to continue...")
+            input("Press Enter to continue...")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU scheduling algorithm visualizer")
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse comparison results saved on disk by earlier sessions")
+    if parser.parse_args().cache:
+        _comparison_cache_enabled = True
     main()
\ No newline at end of file
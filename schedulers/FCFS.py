@@ -3,9 +3,11 @@ from typing import Optional, List
 import random
 import csv
 import argparse
-import copy
+import sys
+from operator import attrgetter
 from ProcessClass.process import Process
 from utils.file_io import write_execution_csv
+from utils.gantt_chart import GanttChart
 
 
 class FCFSScheduler:
@@ -21,10 +23,10 @@ class FCFSScheduler:
         Args:
             processes (List[Process]): List of processes to be scheduled.
         """
-        self.processes = copy.deepcopy(processes)  # Create a deep copy to preserve original list
+        self.processes = [p.copy() for p in processes]  # Copy each process to preserve original list
         self.current_time = 0                      # Track current simulation time
         self.execution_log = []                    # Log of events during execution
-        self.gantt_chart = []                      # Stores execution timeline for Gantt chart
+        self.gantt_chart = GanttChart()            # Stores execution timeline for Gantt chart
     
     def run(self) -> List[Process]:
         """
@@ -35,7 +37,7 @@ class FCFSScheduler:
         if not self.processes:
             return []  # Return empty if there are no processes
         
-        self.processes.sort(key=lambda p: p.arrival_time)  # Sort processes by arrival time
+        self.processes.sort(key=attrgetter('arrival_time'))  # Sort processes by arrival time
         self.current_time = self.processes[0].arrival_time  # Start time is first arrival
 
         for process in self.processes:
@@ -62,7 +64,7 @@ class FCFSScheduler:
             log_entry = f"Time {self.current_time}: Completed Process {process.id}"  # Log process completion
             self.execution_log.append(log_entry)
 
-            write_execution_csv(self.gantt_chart)  # Save Gantt chart to CSV
+        write_execution_csv(self.gantt_chart)  # Save Gantt chart to CSV once the schedule is complete
 
         return self.processes  # Return the updated process list
 
@@ -82,7 +84,7 @@ class FCFSScheduler:
             return 0.0
         
         # Total idle time from Gantt chart
-        idle_time = sum(end_time - start_time for proc_id, start_time, end_time in self.gantt_chart if proc_id == "IDLE")
+        idle_time = self.gantt_chart.idle_time()
         
         # CPU usage is active time divided by total time
         active_time = total_time - idle_time
@@ -98,8 +100,7 @@ class FCFSScheduler:
             print("No processes were executed")
             return
         
-        print("\nGantt Chart:")
-        print("-" * 50)
+        lines = ["\nGantt Chart:", "-" * 50]
 
         for proc_id, start_time, end_time in self.gantt_chart:
             duration = end_time - start_time
@@ -107,8 +108,9 @@ class FCFSScheduler:
                 chart_bar = f"| {'IDLE':<{duration}} "  # Visualize idle time
             else:
                 chart_bar = f"| P{proc_id:<{duration}} "  # Visualize process execution
-            print(f"Time {start_time: <3} {chart_bar}| Time {end_time:<3}")
-        print("-" * 50)
+            lines.append(f"Time {start_time: <3} {chart_bar}| Time {end_time:<3}")
+        lines.append("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")  # Write the chart in one call
 
     def print_execution_log(self) -> None:
         """
@@ -118,8 +120,4 @@ class FCFSScheduler:
             print("No execution log available.")
             return 
         
-        print("\nExecution Log: ")
-        print("-" * 50)
-        for entry in self.execution_log:
-            print(entry)  # Display each log entry
-        print("-" * 50)
+        sys.stdout.write("\n".join(["\nExecution Log: ", "-" * 50, *self.execution_log, "-" * 50]) + "\n")
@@ -3,9 +3,12 @@ from typing import Optional, List
 import random
 import csv
 import argparse
-import copy
+import heapq
+import sys
+from operator import attrgetter
 from ProcessClass.process import Process  
 from utils.file_io import write_execution_csv
+from utils.gantt_chart import GanttChart
 
 
 class PriorityScheduler:
@@ -19,7 +22,7 @@ class PriorityScheduler:
         processes (List[Process]): List of processes to schedule.
         current_time (int): Current simulation time.
         execution_log (List[str]): Log to track execution history.
-        gantt_chart (List[tuple]): For visualizing the execution sequence.
+        gantt_chart (GanttChart): For visualizing the execution sequence.
     """
     
     def __init__(self, processes: List[Process]):
@@ -29,10 +32,10 @@ class PriorityScheduler:
         Args:
             processes: List of Process objects to schedule
         """
-        self.processes = copy.deepcopy(processes)  # Make a deep copy to preserve original list
+        self.processes = [p.copy() for p in processes]  # Copy each process to preserve original list
         self.current_time = 0  # Initialize simulation clock
         self.execution_log = []  # List to keep textual log of events
-        self.gantt_chart = []  # List to represent the Gantt chart (execution timeline)
+        self.gantt_chart = GanttChart()  # Gantt chart segments (execution timeline)
         
     def run(self) -> List[Process]:
         """
@@ -44,26 +47,31 @@ class PriorityScheduler:
         if not self.processes:
             return []
             
-        self.processes.sort(key=lambda p: p.arrival_time)  # Sort processes by arrival time
+        self.processes.sort(key=attrgetter('arrival_time'))  # Sort processes by arrival time
         self.current_time = self.processes[0].arrival_time  # Start at first arrival time
         
-        remaining_processes = copy.deepcopy(self.processes)  # Copy for manipulation
         completed_processes = []  # List to collect finished processes
+        ready = []  # Min-heap of (priority, arrival_time, id, index) for arrived processes
+        next_index = 0  # Index of the next process (in arrival order) not yet pushed to the heap
+        n = len(self.processes)
         
-        while remaining_processes:
-            # Get all processes that have arrived by current time
-            available_processes = [p for p in remaining_processes if p.arrival_time <= self.current_time]
+        while ready or next_index < n:
+            # Push every process that has arrived by the current time
+            while next_index < n and self.processes[next_index].arrival_time <= self.current_time:
+                process = self.processes[next_index]
+                heapq.heappush(ready, (process.priority, process.arrival_time, process.id, next_index))
+                next_index += 1
             
-            if not available_processes:
+            if not ready:
                 # If no process has arrived yet, CPU stays idle
-                next_arrival = min(p.arrival_time for p in remaining_processes)
+                next_arrival = self.processes[next_index].arrival_time
                 self.gantt_chart.append(("IDLE", self.current_time, next_arrival))
                 self.execution_log.append(f"Time {self.current_time}: CPU idle until {next_arrival}")
                 self.current_time = next_arrival
                 continue
             
             # Select process with highest priority (lowest value), breaking ties with arrival time and ID
-            selected_process = min(available_processes, key=lambda p: (p.priority, p.arrival_time, p.id))
+            selected_process = self.processes[heapq.heappop(ready)[3]]
 
             selected_process.state = "READY"  # Set process state
             selected_process.last_running_time = max(selected_process.arrival_time, self.current_time)
@@ -91,7 +99,6 @@ class PriorityScheduler:
             log_entry = f"Time {self.current_time}: Completed Process {selected_process.id}"
             self.execution_log.append(log_entry)
             
-            remaining_processes.remove(selected_process)  # Remove from waiting list
             completed_processes.append(selected_process)  # Add to completed list
         
         self.processes = completed_processes  # Save final state
@@ -115,7 +122,7 @@ class PriorityScheduler:
             return 0.0
         
         # Time when CPU was idle
-        idle_time = sum(end_time - start_time for proc_id, start_time, end_time in self.gantt_chart if proc_id == "IDLE")
+        idle_time = self.gantt_chart.idle_time()
         
         # Time when CPU was actively processing
         active_time = total_time - idle_time
@@ -129,19 +136,19 @@ class PriorityScheduler:
             print("No processes were executed.")
             return
             
-        print("\nGantt Chart:")
-        print("-" * 50)
+        lines = ["\nGantt Chart:", "-" * 50]
         
-        # Print each segment in Gantt chart
+        # Format each segment in Gantt chart
         for proc_id, start_time, end_time in self.gantt_chart:
             duration = end_time - start_time
             if proc_id == "IDLE":
                 chart_bar = f"| {'IDLE':<{duration}} "
             else:
                 chart_bar = f"| P{proc_id:<{duration}} "
-            print(f"Time {start_time:<3} {chart_bar}| Time {end_time:<3}")
+            lines.append(f"Time {start_time:<3} {chart_bar}| Time {end_time:<3}")
             
-        print("-" * 50)
+        lines.append("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")  # Write the whole chart at once
     
     def print_execution_log(self) -> None:
         """Print the execution log."""
@@ -149,8 +156,4 @@ class PriorityScheduler:
             print("No execution log available.")
             return
             
-        print("\nExecution Log:")
-        print("-" * 50)
-        for entry in self.execution_log:
-            print(entry)
-        print("-" * 50)
+        sys.stdout.write("\n".join(["\nExecution Log:", "-" * 50, *self.execution_log, "-" * 50]) + "\n")
@@ -3,10 +3,12 @@ from typing import Optional, List
 import random
 import csv
 import argparse
-import copy
+import sys
+from operator import attrgetter
 from collections import deque
 from ProcessClass.process import Process
 from utils.file_io import write_execution_csv
+from utils.gantt_chart import GanttChart
 
 class RoundRobinScheduler:
     """
@@ -20,7 +22,7 @@ class RoundRobinScheduler:
         time_quantum (int): Duration of each time slice allocated to a process.
         current_time (int): Keeps track of simulation progress.
         execution_log (List[str]): Records details of process execution events.
-        gantt_chart (List[tuple]): Stores data for timeline visualization.
+        gantt_chart (GanttChart): Stores data for timeline visualization.
     """
 
     def __init__(self, processes: List[Process], time_quantum: int = 2):
@@ -31,12 +33,11 @@ class RoundRobinScheduler:
             processes: List of Process instances to simulate.
             time_quantum: Fixed duration of CPU allocation per cycle.
         """
-        self.original_processes = copy.deepcopy(processes)
-        self.processes = copy.deepcopy(processes)
+        self.processes = [p.copy() for p in processes]
         self.time_quantum = time_quantum
         self.current_time = 0
         self.execution_log = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart()
 
     def run(self) -> List[Process]:
         """
@@ -51,67 +52,72 @@ class RoundRobinScheduler:
         # Preparing each process for simulation
         for p in self.processes:
             p.remaining_time = p.burst_time
-            p.first_response = False
-            p.finished = False
+            p.response_time = None
+            p.state = "READY"
 
         # Sorting processes by arrival to ensure correct startup order
-        self.processes.sort(key=lambda p: p.arrival_time)
+        self.processes.sort(key=attrgetter('arrival_time'))
         ready_queue = deque()
         completed = 0
         n = len(self.processes)
-        self.current_time = self.processes[0].arrival_time
 
-        while completed < n:
-            # Gathering processes that have arrived and are not yet finished or queued
-            new_arrivals = [p for p in self.processes
-                            if p.arrival_time <= self.current_time and not p.finished and p not in ready_queue]
+        # Binding hot attributes and methods to locals for the simulation loop
+        processes = self.processes
+        arrival_times = [p.arrival_time for p in processes]
+        time_quantum = self.time_quantum
+        log = self.execution_log.append
+        record = self.gantt_chart.append_merged
+        current_time = arrival_times[0]
 
-            # Ensuring the current process isn't added twice
-            if 'process' in locals():
-                new_arrivals = [p for p in new_arrivals if p != process]
+        next_arrival = 0  # Index of the next process (in arrival order) not yet queued
 
-            # Adding new arrivals to the ready queue while maintaining order
-            new_arrivals.sort(key=lambda p: p.arrival_time)
-            ready_queue.extend(new_arrivals)
+        while completed < n:
+            # Queuing processes that have arrived; every earlier one is already queued, running or finished
+            while next_arrival < n and arrival_times[next_arrival] <= current_time:
+                ready_queue.append(processes[next_arrival])
+                next_arrival += 1
 
             if ready_queue:
                 # Fetching the next process to execute
                 process = ready_queue.popleft()
 
                 # Recording first response time
-                if not process.first_response:
-                    process.response_time = self.current_time - process.arrival_time
-                    process.first_response = True
+                if process.response_time is None:
+                    process.response_time = current_time - process.arrival_time
 
                 # Determining the time slice for execution
-                exec_time = min(self.time_quantum, process.remaining_time)
-                self.execution_log.append(f"Time {self.current_time}: Running Process {process.id} for {exec_time} units")
-                self.gantt_chart.append((process.id, self.current_time, self.current_time + exec_time))
+                remaining_time = process.remaining_time
+                exec_time = time_quantum if remaining_time > time_quantum else remaining_time
+                log(f"Time {current_time}: Running Process {process.id} for {exec_time} units")
+                record((process.id, current_time, current_time + exec_time))
 
-                self.current_time += exec_time
+                current_time += exec_time
                 process.remaining_time -= exec_time
 
                 # Adding new arrivals that appeared during this time slice
-                for p in self.processes:
-                    if (p.arrival_time <= self.current_time and not p.finished and p not in ready_queue and p != process):
-                        ready_queue.append(p)
+                while next_arrival < n and arrival_times[next_arrival] <= current_time:
+                    ready_queue.append(processes[next_arrival])
+                    next_arrival += 1
 
                 if process.remaining_time == 0:
                     # Completing the process
-                    process.completion_time = self.current_time
-                    process.turnaround_time = process.completion_time - process.arrival_time
+                    process.completion_time = current_time
+                    process.turnaround_time = current_time - process.arrival_time
                     process.waiting_time = process.turnaround_time - process.burst_time
-                    process.finished = True
-                    self.execution_log.append(f"Time {self.current_time}: Completed Process {process.id}")
+                    process.state = "COMPLETED"
+                    log(f"Time {current_time}: Completed Process {process.id}")
                     completed += 1
                 else:
                     # Re-queuing the process for the next cycle
                     ready_queue.append(process)
             else:
-                # Recording idle time when no process is available
-                self.gantt_chart.append(("IDLE", self.current_time, self.current_time + 1))
-                self.execution_log.append(f"Time {self.current_time}: CPU idle")
-                self.current_time += 1
+                # Recording idle time until the next process arrives
+                arrival_time = arrival_times[next_arrival]
+                record(("IDLE", current_time, arrival_time))
+                log(f"Time {current_time}: CPU idle until {arrival_time}")
+                current_time = arrival_time
+
+        self.current_time = current_time
 
         # Saving the Gantt chart results
         write_execution_csv(self.gantt_chart)
@@ -131,7 +137,7 @@ class RoundRobinScheduler:
         if total_time <= 0:
             return 0.0
 
-        idle_time = sum(end_time - start_time for proc_id, start_time, end_time in self.gantt_chart if proc_id == "IDLE")
+        idle_time = self.gantt_chart.idle_time()
         active_time = total_time - idle_time
         cpu_usage = (active_time / total_time) * 100
         return cpu_usage
@@ -144,11 +150,12 @@ class RoundRobinScheduler:
             print("No processes were executed.")
             return
 
-        print("\nGantt Chart:")
-        print("-" * 50)
-        for proc_id, start_time, end_time in self.gantt_chart:
-            print(f"Time {start_time:<3} | {'IDLE' if proc_id == 'IDLE' else f'P{proc_id}'} | Time {end_time:<3}")
-        print("-" * 50)
+        separator = "-" * 50 + "\n"
+        sys.stdout.write("".join([
+            "\nGantt Chart:\n", separator,
+            *(f"Time {start_time:<3} | {'IDLE' if proc_id == 'IDLE' else f'P{proc_id}'} | Time {end_time:<3}\n"
+              for proc_id, start_time, end_time in self.gantt_chart),
+            separator]))
 
     def print_execution_log(self) -> None:
         """
@@ -158,8 +165,5 @@ class RoundRobinScheduler:
             print("No execution log available.")
             return
 
-        print("\nExecution Log:")
-        print("-" * 80)
-        for entry in self.execution_log:
-            print(entry)
-        print("-" * 80)
+        separator = "-" * 80
+        sys.stdout.write("\n".join(["\nExecution Log:", separator, *self.execution_log, separator]) + "\n")
@@ -3,10 +3,12 @@ from typing import Optional, List
 import random
 import csv
 import argparse
-import copy
-from collections import deque
+import heapq
+import sys
+from operator import attrgetter
 from ProcessClass.process import Process
 from utils.file_io import write_execution_csv
+from utils.gantt_chart import GanttChart
 
 class PriorityRoundRobinScheduler:
     """
@@ -16,29 +18,55 @@ class PriorityRoundRobinScheduler:
     - Processes are organized in priority levels
     - Within each priority level, Round Robin scheduling is applied
     - Higher priority processes always execute before lower priority ones
+    - Optionally, waiting processes age towards higher priority levels
     
     Attributes:
         processes (List[Process]): List of processes to schedule.
         time_quantum (int): Fixed time slice allocated to each process.
+        aging_factor (Optional[int]): Time units of waiting that raise a process
+            by one priority level, or None to disable aging.
         current_time (int): Current simulation time.
         execution_log (List[str]): Log to track execution history.
-        gantt_chart (List[tuple]): For visualizing the execution sequence.
+        gantt_chart (GanttChart): For visualizing the execution sequence.
     """
     
-    def __init__(self, processes: List[Process], time_quantum: int = 2):
+    def __init__(self, processes: List[Process], time_quantum: int = 2, aging_factor: Optional[int] = None):
         """
         Initialize the Priority Round Robin scheduler with a list of processes.
         
         Args:
             processes: List of Process objects to schedule
             time_quantum: Time slice allocated to each process
+            aging_factor: Optional aging interval; None keeps priorities fixed
+        
+        Raises:
+            ValueError: If aging_factor is not a positive integer.
         """
-        # Create a deep copy of input processes to avoid side effects
-        self.processes = copy.deepcopy(processes)
+        if aging_factor is not None and aging_factor <= 0:
+            raise ValueError(f"aging_factor must be a positive integer, got {aging_factor}")
+        # Copy each input process to avoid side effects
+        self.processes = [p.copy() for p in processes]
         self.time_quantum = time_quantum
+        self.aging_factor = aging_factor
         self.current_time = 0
         self.execution_log = []  # Stores human-readable execution messages
-        self.gantt_chart = []    # Tracks the execution timeline
+        self.gantt_chart = GanttChart()  # Tracks the execution timeline
+    
+    def _queue_priority(self, process: Process) -> int:
+        """
+        Compute the heap key of a process entering the ready heap.
+        
+        With aging, a process gains one priority level per `aging_factor` time units
+        spent waiting, i.e. its aged priority at time t is
+        `priority - (t - arrival_time - cpu_time_acquired) / aging_factor`. Scaling by
+        `aging_factor` and dropping the t term, which is shared by every waiter, gives
+        `priority * aging_factor + arrival_time + cpu_time_acquired`: the same order,
+        and a key that only changes while the process runs, so it is recomputed when the
+        process is pushed back. Processes with equal keys take turns in Round Robin order.
+        """
+        if self.aging_factor is None:
+            return process.priority
+        return process.priority * self.aging_factor + process.arrival_time + process.cpu_time_acquired
     
     def run(self) -> List[Process]:
         """
@@ -51,102 +79,92 @@ class PriorityRoundRobinScheduler:
             return []
         
         # Sort processes by arrival time to simulate realistic arrival order
-        self.processes.sort(key=lambda p: p.arrival_time)
+        self.processes.sort(key=attrgetter('arrival_time'))
         self.current_time = self.processes[0].arrival_time
         
-        # Make a working copy to manage state changes during scheduling
-        remaining_processes = copy.deepcopy(self.processes)
+        # The constructor already copied the input, so schedule the sorted list in place
+        remaining_processes = self.processes
         completed_processes = []
 
-        # Dictionary to hold queues of processes grouped by priority
-        priority_queues = {}
+        # Min-heap of (queue priority, seq, index) entries; seq keeps each priority level first-in first-out
+        ready = []
+        seq = 0
+        n = len(remaining_processes)
+        next_index = 0  # Index of the next process (in arrival order) not yet admitted
 
-        # Load initial processes that have arrived into their respective queues
-        for process in remaining_processes:
-            if process.arrival_time <= self.current_time:
-                if process.priority not in priority_queues:
-                    priority_queues[process.priority] = deque()
-                priority_queues[process.priority].append(process)
+        # Compute every admission key once (only aged keys change later); bind hot attributes to locals
+        queue_keys = [self._queue_priority(p) for p in remaining_processes]
+        aging = self.aging_factor is not None
+        arrival_times = [p.arrival_time for p in remaining_processes]
+        time_quantum = self.time_quantum
+        log = self.execution_log.append
+        record = self.gantt_chart.append_merged
+        push, pop = heapq.heappush, heapq.heappop
+        current_time = self.current_time
         
         # Main scheduling loop: continues while there are uncompleted or arriving processes
-        while priority_queues or any(p for p in remaining_processes if p not in completed_processes):
-            # If no processes are ready, CPU goes idle
-            if not priority_queues:
-                next_processes = [p for p in remaining_processes if p not in completed_processes]
-                next_arrival = min(p.arrival_time for p in next_processes)
+        while ready or len(completed_processes) < n:
+            # Load processes that have arrived into the ready heap
+            while next_index < n and arrival_times[next_index] <= current_time:
+                push(ready, (queue_keys[next_index], seq, next_index))
+                seq += 1
+                next_index += 1
+
+            # If no processes are ready, CPU goes idle until the next arrival
+            if not ready:
+                next_arrival = arrival_times[next_index]
                 
                 # Log idle time
-                self.gantt_chart.append(("IDLE", self.current_time, next_arrival))
-                self.execution_log.append(f"Time {self.current_time}: CPU idle until {next_arrival}")
-                self.current_time = next_arrival
-
-                # Load newly arrived processes into queues
-                for p in next_processes:
-                    if p.arrival_time <= self.current_time and p not in completed_processes:
-                        if p.priority not in priority_queues:
-                            priority_queues[p.priority] = deque()
-                        priority_queues[p.priority].append(p)
+                record(("IDLE", current_time, next_arrival))
+                log(f"Time {current_time}: CPU idle until {next_arrival}")
+                current_time = next_arrival
                 continue
             
-            # Pick the highest priority queue (lower number = higher priority)
-            highest_priority = min(priority_queues.keys())
-            current_queue = priority_queues[highest_priority]
-            current_process = current_queue.popleft()
+            # Pick the earliest queued process of the highest priority (lower number = higher priority)
+            _, _, current_index = pop(ready)
+            current_process = remaining_processes[current_index]
             
             # Calculate response time if it's the process's first execution
             if current_process.response_time is None and current_process.cpu_time_acquired == 0:
-                current_process.response_time = self.current_time - current_process.arrival_time
-            
-            # Update waiting time for subsequent executions
-            if current_process.cpu_time_acquired > 0:
-                wait_time = self.current_time - current_process.arrival_time - current_process.burst_time
-                current_process.waiting_time += wait_time
+                current_process.response_time = current_time - current_process.arrival_time
             
             # Log execution details
-            log_entry = f"Time {self.current_time}: Running Process {current_process.id} "
-            log_entry += f"(priority: {current_process.priority}, remaining: {current_process.remaining_time}, quantum: {self.time_quantum})"
-            self.execution_log.append(log_entry)
+            log(f"Time {current_time}: Running Process {current_process.id} "
+                f"(priority: {current_process.priority}, remaining: {current_process.remaining_time}, quantum: {time_quantum})")
 
             # Simulate process execution
             current_process.state = "RUNNING"
-            time_slice = min(self.time_quantum, current_process.remaining_time)
+            remaining_time = current_process.remaining_time
+            time_slice = time_quantum if remaining_time > time_quantum else remaining_time
             time_used = current_process.execute(time_slice)
 
             # Record execution in Gantt chart
-            self.gantt_chart.append((current_process.id, self.current_time, self.current_time + time_used))
-            current_process.last_running_time = self.current_time + time_used
-            self.current_time += time_used
+            record((current_process.id, current_time, current_time + time_used))
+            current_process.last_running_time = current_time + time_used
+            current_time += time_used
 
-            # Check for new arrivals during the execution and add them to queues
-            for p in remaining_processes:
-                if (p.arrival_time <= self.current_time and 
-                    p not in completed_processes and 
-                    p != current_process):
-                    
-                    # Avoid duplicate entries in queues
-                    in_queue = any(p in queue for queue in priority_queues.values())
-                    if not in_queue:
-                        if p.priority not in priority_queues:
-                            priority_queues[p.priority] = deque()
-                        priority_queues[p.priority].append(p)
+            # Add processes that arrived during the execution to the ready heap
+            while next_index < n and arrival_times[next_index] <= current_time:
+                push(ready, (queue_keys[next_index], seq, next_index))
+                seq += 1
+                next_index += 1
             
             # Decide whether to complete or requeue the process
             if current_process.is_completed():
-                current_process.complete(self.current_time)
-                self.execution_log.append(f"Time {self.current_time}: Completed Process {current_process.id}")
+                current_process.complete(current_time)
+                log(f"Time {current_time}: Completed Process {current_process.id}")
                 completed_processes.append(current_process)
             else:
-                # Requeue the process for further execution
-                if current_process.priority not in priority_queues:
-                    priority_queues[current_process.priority] = deque()
-                priority_queues[current_process.priority].append(current_process)
+                # Requeue the process behind everything already waiting at its priority;
+                # an aged key grows by the CPU time just used, as _queue_priority would compute
+                if aging:
+                    queue_keys[current_index] += time_used
+                push(ready, (queue_keys[current_index], seq, current_index))
+                seq += 1
                 current_process.state = "READY"
-
-            # Clean up any empty queues
-            empty_priorities = [p for p, q in priority_queues.items() if not q]
-            for p in empty_priorities:
-                del priority_queues[p]
         
+        self.current_time = current_time
+
         # Save Gantt chart to file
         self.processes = completed_processes
         write_execution_csv(self.gantt_chart)
@@ -168,7 +186,7 @@ class PriorityRoundRobinScheduler:
             return 0.0
         
         # Compute total idle time from Gantt chart
-        idle_time = sum(end_time - start_time for proc_id, start_time, end_time in self.gantt_chart if proc_id == "IDLE")
+        idle_time = self.gantt_chart.idle_time()
         
         # Calculate CPU active time and usage
         active_time = total_time - idle_time
@@ -182,14 +200,14 @@ class PriorityRoundRobinScheduler:
             print("No processes were executed.")
             return
             
-        print("\nGantt Chart:")
-        print("-" * 60)
+        lines = ["\nGantt Chart:", "-" * 60]
         
         for proc_id, start_time, end_time in self.gantt_chart:
             proc_label = f"P{proc_id}" if proc_id != "IDLE" else "IDLE"
-            print(f"Time {start_time:<3} | {proc_label:<5} | Time {end_time:<3}")
+            lines.append(f"Time {start_time:<3} | {proc_label:<5} | Time {end_time:<3}")
             
-        print("-" * 60)
+        lines.append("-" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")  # One write for the whole chart
     
     def print_execution_log(self) -> None:
         """Print the execution log."""
@@ -197,8 +215,4 @@ class PriorityRoundRobinScheduler:
             print("No execution log available.")
             return
             
-        print("\nExecution Log:")
-        print("-" * 90)
-        for entry in self.execution_log:
-            print(entry)
-        print("-" * 90)
+        sys.stdout.write("\n".join(["\nExecution Log:", "-" * 90, *self.execution_log, "-" * 90]) + "\n")
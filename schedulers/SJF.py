@@ -1,11 +1,10 @@
-from dataclasses import dataclass, field
-from typing import Optional, List
-import random
-import csv
-import argparse
-import copy
+from typing import List
+import heapq
+import sys
+from operator import attrgetter
 from ProcessClass.process import Process  
 from utils.file_io import write_execution_csv
+from utils.gantt_chart import GanttChart
 
 
 class SJFScheduler:
@@ -23,10 +22,10 @@ class SJFScheduler:
         Args:
             processes: List of Process objects to be scheduled
         """
-        self.processes = copy.deepcopy(processes)  # Working with a deep copy to preserve original input
+        self.processes = [p.copy() for p in processes]  # Working with copies to preserve original input
         self.current_time = 0                      # Tracking the current time of simulation
         self.execution_log = []                    # Storing the sequence of process events
-        self.gantt_chart = []                      # Building Gantt chart entries for visual timeline
+        self.gantt_chart = GanttChart()            # Building Gantt chart entries for visual timeline
     
     
     def run(self) -> List[Process]:
@@ -40,26 +39,32 @@ class SJFScheduler:
             return []
 
         # Sorting processes by arrival time to start scheduling in order
-        self.processes.sort(key=lambda p: p.arrival_time)
+        self.processes.sort(key=attrgetter('arrival_time'))
         self.current_time = self.processes[0].arrival_time
 
-        remaining_processes = copy.deepcopy(self.processes)
+        remaining_processes = self.processes  # Already private copies, made in __init__
         completed_processes = []
+        available_processes = []  # Min-heap of (burst_time, arrival_time, index) for arrived processes
+        next_index = 0  # Index of the next process (in arrival order) not yet available
+        n = len(remaining_processes)
 
-        while remaining_processes:
-            # Collecting all processes that have arrived by the current time
-            available_processes = [p for p in remaining_processes if p.arrival_time <= self.current_time]
+        while available_processes or next_index < n:
+            # Collecting the processes that have arrived by the current time
+            while next_index < n and remaining_processes[next_index].arrival_time <= self.current_time:
+                process = remaining_processes[next_index]
+                heapq.heappush(available_processes, (process.burst_time, process.arrival_time, next_index))
+                next_index += 1
 
             if not available_processes:
                 # Simulating idle time until the next process arrives
-                next_arrival = min(p.arrival_time for p in remaining_processes)
+                next_arrival = remaining_processes[next_index].arrival_time
                 self.gantt_chart.append(("IDLE", self.current_time, next_arrival))
                 self.execution_log.append(f"Time {self.current_time}: CPU idle until {next_arrival}")
                 self.current_time = next_arrival
                 continue
 
             # Selecting the process with the shortest burst time (breaking ties by arrival time)
-            selected_process = min(available_processes, key=lambda p: (p.burst_time, p.arrival_time))
+            selected_process = remaining_processes[heapq.heappop(available_processes)[2]]
 
             # Updating process state and timing information
             selected_process.state = "READY"
@@ -84,8 +89,7 @@ class SJFScheduler:
             log_entry = f"Time {self.current_time}: Completed Process {selected_process.id}"
             self.execution_log.append(log_entry)
 
-            # Moving process from remaining to completed list
-            remaining_processes.remove(selected_process)
+            # Adding process to completed list
             completed_processes.append(selected_process)
 
         # Updating internal state to reflect completed scheduling
@@ -111,7 +115,7 @@ class SJFScheduler:
             return 0.0
         
         # Summing the time intervals where the CPU was idle
-        idle_time = sum(end_time - start_time for proc_id, start_time, end_time in self.gantt_chart if proc_id == "IDLE")
+        idle_time = self.gantt_chart.idle_time()
         
         # Calculating CPU active time and converting to percentage
         active_time = total_time - idle_time
@@ -125,8 +129,7 @@ class SJFScheduler:
             print("No processes were executed.")
             return
             
-        print("\nGantt Chart:")
-        print("-" * 50)
+        lines = ["\nGantt Chart:", "-" * 50]
         
         for proc_id, start_time, end_time in self.gantt_chart:
             duration = end_time - start_time
@@ -134,9 +137,10 @@ class SJFScheduler:
                 chart_bar = f"| {'IDLE':<{duration}} "  # Visualizing idle periods
             else:
                 chart_bar = f"| P{proc_id:<{duration}} "  # Visualizing process execution
-            print(f"Time {start_time:<3} {chart_bar}| Time {end_time:<3}")
+            lines.append(f"Time {start_time:<3} {chart_bar}| Time {end_time:<3}")
             
-        print("-" * 50)
+        lines.append("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")  # Emitting the chart with a single write
     
     def print_execution_log(self) -> None:
         """Displaying the sequence of process execution events."""
@@ -144,8 +148,4 @@ class SJFScheduler:
             print("No execution log available.")
             return
             
-        print("\nExecution Log:")
-        print("-" * 50)
-        for entry in self.execution_log:
-            print(entry)
-        print("-" * 50)
+        sys.stdout.write("\n".join(["\nExecution Log:", "-" * 50, *self.execution_log, "-" * 50]) + "\n")
@@ -1,9 +1,10 @@
 # system/system.py
 
 from ProcessClass.process import Process
-from typing import List
+from ProcessClass.process_table import ProcessTable
+from typing import List, Optional
+import numpy as np
 import pandas as pd
-import random
 
 class System:
     def __init__(self, processes: List[Process] = None, context_switching_time: int = 0, quantum: int = 1):
@@ -12,39 +13,32 @@ class System:
         self.quantum = quantum
 
     @staticmethod
-    def generate_processes(file_directory: str, number_of_processes: int, max_burst: int, min_burst: int, max_arrival_time: int) -> List[Process]:
-        processes = []
-        with open(file_directory, 'w') as f:
-            f.write("id,burst_time,priority,arrival_time\n")
-            for i in range(1, number_of_processes + 1):
-                burst_time = random.randint(min_burst, max_burst)
-                priority = random.randint(1, 5) # Should see how to enter priority
-                arrival_time = random.randint(0, max_arrival_time)
-                process = Process(id=i, burst_time=burst_time, priority=priority, arrival_time=arrival_time)
-                processes.append(process)
-                f.write(f"{process.id},{process.burst_time},{process.priority},{process.arrival_time}\n")
-        return processes
+    def generate_processes(file_directory: str, number_of_processes: int, max_burst: int, min_burst: int, max_arrival_time: int,
+                           seed: Optional[int] = None) -> List[Process]:
+        # Draw each input column as a whole array, then write the file and build the processes from the table
+        # default_rng only takes non-negative seeds; use abs() as random.seed does for ints
+        rng = np.random.default_rng(None if seed is None else abs(seed))
+        table = ProcessTable.from_columns(
+            np.arange(1, number_of_processes + 1),
+            rng.integers(min_burst, max_burst, size=number_of_processes, endpoint=True),
+            rng.integers(1, 5, size=number_of_processes, endpoint=True),  # Should see how to enter priority
+            rng.integers(0, max_arrival_time, size=number_of_processes, endpoint=True))
+        table.save_csv(file_directory)
+        return table.new_processes()
 
     @staticmethod
     def load_from_csv(file_directory: str) -> List[Process]:
-        df = pd.read_csv(file_directory)
-        processes = []
-        for _, row in df.iterrows():
-            process = Process(
-                id=int(row['id']),
-                burst_time=int(row['burst_time']),
-                priority=int(row['priority']),
-                arrival_time=int(row['arrival_time'])
-            )
-            processes.append(process)
-        return processes
+        # Read the four input columns as whole arrays and build the processes in one pass
+        df = pd.read_csv(file_directory, usecols=list(ProcessTable.INPUT_COLUMNS), dtype=np.int64)
+        table = ProcessTable.from_columns(*(df[column].to_numpy() for column in ProcessTable.INPUT_COLUMNS))
+        return table.new_processes()
 
     @staticmethod
     def save_processes_csv(file_directory: str, processes: List[Process]) -> None:
+        rows = [f"{p.id},{p.burst_time},{p.priority},{p.arrival_time},{p.waiting_time},{p.turnaround_time},{p.completion_time}\n"
+                for p in processes]
         with open(file_directory, 'w') as f:
-            f.write("id,burst_time,priority,arrival_time,waiting_time,turnaround_time,completion_time\n")
-            for p in processes:
-                f.write(f"{p.id},{p.burst_time},{p.priority},{p.arrival_time},{p.waiting_time},{p.turnaround_time},{p.completion_time}\n")
+            f.write("".join(["id,burst_time,priority,arrival_time,waiting_time,turnaround_time,completion_time\n", *rows]))
 
     def system_to_csv(self, file_directory: str) -> None:
         with open(file_directory, 'w') as f:
@@ -1,16 +1,18 @@
 # utils/file_io.py
 import csv
 
+CSV_BUFFER_SIZE = 1 << 20
+
 def write_execution_csv(gantt_chart, filepath="static/csv/execution.csv"):
-    with open(filepath, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=['id', 'start', 'end'])
-        writer.writeheader()
-        for entry in gantt_chart:
-            proc_id, start, end = entry  
-            if proc_id == "IDLE":
-                continue
-            writer.writerow({
-                'id': proc_id,
-                'start': start,
-                'end': end
-            })
+    if hasattr(gantt_chart, "process_rows"):
+        # A GanttChart only holds ints, so no quoting is needed: format everything and write once
+        data = "".join(["id,start,end\r\n",
+                        *(f"{proc_id},{start},{end}\r\n" for proc_id, start, end in gantt_chart.process_rows())])
+        with open(filepath, mode='wb') as file:
+            file.write(data.encode())
+        return
+    # Plain lists of tuples go through the csv module
+    with open(filepath, mode='w', newline='', buffering=CSV_BUFFER_SIZE) as file:
+        writer = csv.writer(file)
+        writer.writerow(('id', 'start', 'end'))
+        writer.writerows(entry for entry in gantt_chart if entry[0] != "IDLE")
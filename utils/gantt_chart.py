@@ -0,0 +1,90 @@
+from array import array
+from typing import Iterator, Tuple, Union
+
+import numpy as np
+
+ProcessId = Union[int, str]
+
+
+class GanttChart:
+    """
+    Struct-of-Arrays execution timeline.
+
+    Each segment is stored as three packed int64 values (process id, start, end)
+    instead of a tuple of boxed ints. Idle segments use the IDLE_ID sentinel.
+    The chart still behaves like the list of `(proc_id, start, end)` tuples the
+    schedulers used to build, so printing and CSV export code can iterate it unchanged.
+
+    Attributes:
+        ids (array): Process id of each segment, or IDLE_ID for idle time.
+        starts (array): Start time of each segment.
+        ends (array): End time of each segment.
+    """
+
+    IDLE = "IDLE"
+    IDLE_ID = -1
+
+    def __init__(self):
+        self.ids = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+
+    def append(self, entry: Tuple[ProcessId, int, int]) -> None:
+        """
+        Record one segment of the timeline.
+
+        Args:
+            entry: `(proc_id, start, end)`, where proc_id is a process id or "IDLE".
+        """
+        proc_id, start, end = entry
+        self.ids.append(self.IDLE_ID if proc_id == self.IDLE else proc_id)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def append_merged(self, entry: Tuple[ProcessId, int, int]) -> None:
+        """
+        Record one segment, extending the previous one instead when the same
+        process (or idle time) continues exactly where it ended.
+
+        Args:
+            entry: `(proc_id, start, end)`, where proc_id is a process id or "IDLE".
+        """
+        proc_id, start, end = entry
+        if proc_id == self.IDLE:
+            proc_id = self.IDLE_ID
+        if self.ids and self.ids[-1] == proc_id and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+        self.ids.append(proc_id)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Tuple[ProcessId, int, int]:
+        """Return one segment as a `(proc_id, start, end)` tuple."""
+        proc_id = self.ids[index]
+        return (self.IDLE if proc_id == self.IDLE_ID else proc_id), self.starts[index], self.ends[index]
+
+    def __iter__(self) -> Iterator[Tuple[ProcessId, int, int]]:
+        """Iterate over the segments as `(proc_id, start, end)` tuples."""
+        idle, idle_id = self.IDLE, self.IDLE_ID
+        return ((idle if proc_id == idle_id else proc_id, start, end)
+                for proc_id, start, end in zip(self.ids, self.starts, self.ends))
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return zero-copy NumPy views of the id, start and end columns."""
+        return (np.frombuffer(self.ids, dtype=np.int64), np.frombuffer(self.starts, dtype=np.int64),
+                np.frombuffer(self.ends, dtype=np.int64))
+
+    def idle_time(self) -> int:
+        """Total duration of the idle segments, computed with one masked reduction."""
+        ids, starts, ends = self.columns()
+        idle = ids == self.IDLE_ID
+        return int((ends[idle] - starts[idle]).sum())
+
+    def process_rows(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate over the `(proc_id, start, end)` segments that ran a process, skipping idle time."""
+        idle_id = self.IDLE_ID
+        return (row for row in zip(self.ids, self.starts, self.ends) if row[0] != idle_id)